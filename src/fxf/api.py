@@ -1,5 +1,12 @@
+from importlib.util import find_spec
+
 import httpx
 
+DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# HTTP/2 needs the optional h2 package (httpx's "http2" extra)
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
 
 def auto_raise(response: httpx.Response):
     """Hook for HTTPX to auto-raise for status"""
@@ -9,6 +16,14 @@ def auto_raise(response: httpx.Response):
     return response
 
 
+async def async_auto_raise(response: httpx.Response):
+    """Asynchronous version of auto_raise()"""
+
+    await response.aread()
+    response.raise_for_status()
+    return response
+
+
 class MeApi:
     """Wrapper around the self user API"""
 
@@ -22,6 +37,19 @@ class MeApi:
         return self.client.get("me/").json()
 
 
+class AsyncMeApi:
+    """Asynchronous wrapper around the self user API"""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+
+    async def get_current_user(self) -> dict:
+        """Retrieves information about the current user (either authenticated
+        or not)."""
+
+        return (await self.client.get("me/")).json()
+
+
 class ProjectApi:
     def __init__(self, client: httpx.Client):
         self.client = client
@@ -42,12 +70,45 @@ class ProjectApi:
         ).json()
 
 
+def client_options(base_url: str, token: str, limits: httpx.Limits) -> dict:
+    """Options common to the sync and async HTTPX clients of an instance.
+    HTTP/2 is enabled, when h2 is installed, so that concurrent requests to
+    the same instance get multiplexed over a single connection."""
+
+    return dict(
+        base_url=httpx.URL(base_url).join("/back/api/"),
+        headers={
+            "Authorization": f"Token {token}",
+        },
+        limits=limits,
+        http2=HTTP2_AVAILABLE,
+    )
+
+
+class AsyncProjectApi:
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+
+    async def resolve(self, remote: str) -> dict:
+        """Resolves a remote to a project"""
+
+        return (
+            await self.client.get("project/resolve/", params={"remote": remote})
+        ).json()
+
+
 class ApiFactory:
     """Factory for API clients"""
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+    ):
         self.token = token
         self.base_url = base_url
+        self.limits = limits
         self.client = None
         self._depth = 0
 
@@ -56,10 +117,7 @@ class ApiFactory:
 
         if not self._depth:
             self.client = httpx.Client(
-                base_url=httpx.URL(self.base_url).join("/back/api/"),
-                headers={
-                    "Authorization": f"Token {self.token}",
-                },
+                **client_options(self.base_url, self.token, self.limits),
                 event_hooks=dict(
                     response=[auto_raise],
                 ),
@@ -87,3 +145,47 @@ class ApiFactory:
         """Returns the "Project" namespace of the API"""
 
         return ProjectApi(self.client)
+
+
+class AsyncApiFactory:
+    """Factory for asynchronous API clients, used to query several instances
+    concurrently"""
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+    ):
+        self.token = token
+        self.base_url = base_url
+        self.limits = limits
+        self.client = None
+
+    async def __aenter__(self) -> "AsyncApiFactory":
+        """Creates the client"""
+
+        self.client = httpx.AsyncClient(
+            **client_options(self.base_url, self.token, self.limits),
+            event_hooks=dict(
+                response=[async_auto_raise],
+            ),
+        )
+        await self.client.__aenter__()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Releases the client"""
+
+        await self.client.__aexit__(exc_type, exc_val, exc_tb)
+
+    def me(self) -> "AsyncMeApi":
+        """Returns the "Me" namespace of the API"""
+
+        return AsyncMeApi(self.client)
+
+    def project(self) -> "AsyncProjectApi":
+        """Returns the "Project" namespace of the API"""
+
+        return AsyncProjectApi(self.client)
@@ -0,0 +1,60 @@
+from importlib import import_module
+from typing import List, Mapping, Optional
+
+import rich_click as click
+
+
+class LazyGroup(click.RichGroup):
+    """Group whose sub-commands live in their own modules and only get
+    imported when Click needs them, so that a command doesn't pay for the
+    dependencies of all the others."""
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: Optional[Mapping[str, str]] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Imports the command from its "module:attribute" reference"""
+
+        module_name, attr = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+        return getattr(import_module(module_name), attr)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "auth": "fxf.cli.auth:auth",
+        "project": "fxf.cli.project:project",
+    },
+)
+@click.version_option(package_name="fxf")
+@click.option(
+    "-p",
+    "--profile",
+    help=("Scope all operations to this profile"),
+    default="default",
+)
+@click.pass_context
+def main(ctx: click.Context, profile: str):
+    """The local counterpart of Flux Capacitor that will help you manage
+    projects on your local machine."""
+
+    from ..config import ConfigManager
+
+    ctx.ensure_object(ConfigManager)
+    ctx.obj.profile = profile
+    ctx.call_on_close(ctx.obj.close_all)
@@ -0,0 +1,130 @@
+from typing import TYPE_CHECKING, List, Sequence, Tuple
+
+import rich_click as click
+
+from ..errors import FxfError, MissingTokenError
+
+if TYPE_CHECKING:
+    from ..config import ConfigManager
+
+
+@click.group()
+def auth():
+    """Manage authentication and Flux Capacitor instances."""
+
+
+def _get_token(cm: "ConfigManager", instance_url: str) -> Tuple[dict, str]:
+    import httpx
+    from rich.prompt import Prompt
+
+    is_valid = False
+    next_message = "[cyan]What is your [bold]token[/bold]?[/cyan]"
+    token = ""
+
+    while not is_valid:
+        token = Prompt.ask(next_message, password=True)
+        next_message = "[red][bold]Invalid[/bold] token, please try again[/red]"
+
+        with cm.get_api(instance_url, token) as api:
+            try:
+                user = api.me().get_current_user()
+
+                if user["type"] == "authenticated":
+                    is_valid = True
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 403:
+                    raise FxfError(f"Unexpected error: {e}")
+            except httpx.UnsupportedProtocol:
+                raise FxfError(f"Invalid URL: {instance_url}")
+
+    return user, token
+
+
+@auth.command()
+@click.option(
+    "-u",
+    "--instance-url",
+    help="Base URL of the instance to login to.",
+    required=True,
+)
+@click.pass_context
+def login(ctx: click.Context, instance_url: str):
+    """Login to a Flux Capacitor instance, based on the provided instance
+    url."""
+
+    from rich import print
+
+    cm: ConfigManager = ctx.obj
+
+    user, token = _get_token(cm, instance_url)
+
+    print(
+        f"[green]Welcome [bold]{user['first_name']} {user['last_name']}[/bold][/green]"
+    )
+    cm.save_credentials(instance_url, token)
+
+
+async def _probe(cm: "ConfigManager", domain: str) -> str:
+    """Checks the token of a domain and returns the status to display"""
+
+    import httpx
+
+    try:
+        async with cm.get_async_api(domain) as api:
+            user = await api.me().get_current_user()
+
+            if user["type"] == "authenticated":
+                return "[green]OK[/]"
+            else:
+                return "[red]Not Authenticated[/]"
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 403:
+            return "[red]Invalid Token[/]"
+        else:
+            return f"[red]HTTP {e.response.status_code}[/]"
+    except httpx.TransportError:
+        return "[red]Unreachable[/]"
+    except MissingTokenError:
+        return "[red]No Token[/]"
+
+
+async def _probe_all(cm: "ConfigManager", domains: Sequence[str]) -> List[str]:
+    """Probes all domains concurrently"""
+
+    import asyncio
+
+    return await asyncio.gather(*[_probe(cm, domain) for domain in domains])
+
+
+@auth.command()
+@click.pass_context
+def test(ctx: click.Context):
+    """Tests all registered authentication tokens."""
+
+    import asyncio
+
+    import rich.console
+    import rich.table
+    from rich import print
+
+    cm: ConfigManager = ctx.obj
+
+    domains = list(dict.fromkeys(cm.get_profile().get("domains", [])))
+
+    if not domains:
+        print("[red]No domains found[/]")
+        print("[cyan]Run [bold]fxf auth login[/bold] to login to an instance[/]")
+        return
+
+    table = rich.table.Table()
+
+    table.add_column("Instance URL", style="cyan")
+    table.add_column("Status")
+
+    statuses = asyncio.run(_probe_all(cm, domains))
+
+    for domain, status in zip(domains, statuses):
+        table.add_row(domain, status)
+
+    console = rich.console.Console()
+    console.print(table)
@@ -0,0 +1,200 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+import rich_click as click
+
+if TYPE_CHECKING:
+    from ..config import ConfigManager
+
+
+@click.group()
+def project():
+    """Manage projects and local code repositories."""
+
+
+async def _resolve_origin(
+    cm: "ConfigManager", origin: str
+) -> Tuple[Optional[Tuple[str, dict]], Dict[str, str]]:
+    """Asks all the domains of the profile at once which one hosts the project
+    matching this origin. Returns the first (domain, project) found, if any,
+    and cancels the requests still pending at that point.
+
+    Domains that fail to answer (no token, HTTP error, unreachable) don't
+    stop the others: they are returned along with the reason of the failure
+    so that the caller can report them if nothing matched."""
+
+    import asyncio
+
+    import httpx
+
+    from ..errors import MissingTokenError
+
+    async def resolve(domain: str) -> Tuple[str, Optional[dict], Optional[str]]:
+        try:
+            async with cm.get_async_api(domain) as api:
+                resolved = await api.project().resolve(origin)
+        except MissingTokenError:
+            return domain, None, "No Token"
+        except httpx.HTTPStatusError as e:
+            return domain, None, f"HTTP {e.response.status_code}"
+        except httpx.TransportError:
+            return domain, None, "Unreachable"
+
+        return domain, resolved["project"], None
+
+    domains = list(dict.fromkeys(cm.get_profile().get("domains", [])))
+    tasks = [asyncio.create_task(resolve(domain)) for domain in domains]
+    failures = {}
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            domain, project, failure = await next_done
+
+            if project:
+                return (domain, project), {}
+
+            if failure:
+                failures[domain] = failure
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return None, {domain: failures[domain] for domain in domains if domain in failures}
+
+
+def _connect(ctx: click.Context, directory: Path):
+    """Associates a Git repo to a connected instance."""
+
+    import asyncio
+
+    from rich import print
+
+    cm: ConfigManager = ctx.obj
+
+    if not cm.has_credentials():
+        raise click.ClickException(
+            "No credentials found, please use 'fxf auth login' first"
+        )
+
+    origin, _ = _find_project_origin(directory)
+
+    print(f"[green]Found Git origin: [white]{origin}[/]")
+    match, failures = asyncio.run(_resolve_origin(cm, origin))
+
+    if not match and failures:
+        raise click.ClickException(
+            "Could not find this project, some of your Flux Capacitor instances "
+            "failed to answer:\n"
+            + "\n".join(f"  {domain}: {reason}" for domain, reason in failures.items())
+        )
+
+    if not match:
+        raise click.ClickException(
+            "None of your Flux Capacitor instances have this project, please "
+            "create it first"
+        )
+
+    domain, project = match
+    print(
+        f"[green]Found project: [white]{project['name']}[green] on [white]{domain}[/]"
+    )
+    cm.save_project(origin, domain, project)
+    print("[green]Connected![/green]")
+
+
+@project.command()
+@click.option(
+    "-d",
+    "--directory",
+    help="Directory where the project is.",
+    type=click.Path(exists=True, dir_okay=True, file_okay=False, path_type=Path),
+    default=Path("."),
+)
+@click.pass_context
+def connect(ctx: click.Context, directory: Path):
+    """Associates a Git repo to a connected instance."""
+
+    return _connect(ctx, directory)
+
+
+def _find_project_origin(directory):
+    from ..project import ProjectManager
+
+    pm = ProjectManager(directory)
+
+    if not pm.is_valid:
+        raise click.ClickException("This directory is not a valid Git repository")
+
+    origin = pm.get_origin()
+
+    if not origin:
+        raise click.ClickException("This repository has no origin")
+
+    return origin, pm
+
+
+@project.command()
+@click.option(
+    "-d",
+    "--directory",
+    help="Directory where the project is.",
+    type=click.Path(exists=True, dir_okay=True, file_okay=False, path_type=Path),
+    default=Path("."),
+)
+@click.pass_context
+def gha(ctx: click.Context, directory: Path):
+    """Generates the GitHub Action files for this project."""
+
+    import httpx
+    import rich.console
+    import rich.table
+    from rich import print
+
+    cm: ConfigManager = ctx.obj
+    origin, pm = _find_project_origin(directory)
+    proj = cm.get_project(origin)
+
+    if not proj:
+        print("[yellow]This project is not connected. Attempting to connect.[/yellow]")
+        _connect(ctx, directory)
+
+    proj = cm.get_project(origin)
+    ff = pm.git_root / "Fluxfile"
+
+    if not ff.exists():
+        raise click.ClickException(
+            "This project has no Fluxfile. Please write it before proceeding."
+        )
+
+    with cm.get_api(proj["domain"]) as api:
+        try:
+            resp = api.project().gha(proj["project"], ff.read_text())
+
+            for file in resp["files"]:
+                path = pm.git_root / file["name"]
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(file["content"])
+                print(f"[green]Generated [white]{file['name']}[/]")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 400:
+                errors = e.response.json().get("fluxfile")
+
+                if not errors:
+                    raise click.ClickException("Unknown error from API")
+
+                table = rich.table.Table()
+
+                table.add_column("Path", style="cyan")
+                table.add_column("Error", style="white")
+
+                for err in errors:
+                    table.add_row(".".join(err["path"]), err["message"])
+
+                print("[red]Invalid Fluxfile[/]")
+
+                console = rich.console.Console()
+                console.print(table)
+            else:
+                raise click.ClickException(f"API error: HTTP {e.response.status_code}")
@@ -1,23 +1,35 @@
 import os
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Mapping, Optional
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple
 
 import appdirs
-import keyring
-import keyring.backend
 import tomlkit
-import tomlkit.items
 
-from .api import ApiFactory
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+from .api import ApiFactory, AsyncApiFactory
 from .errors import MissingTokenError
 
+if TYPE_CHECKING:
+    import keyring.backend
+
 
 class ConfigManager:
     """Manages reading and writing configuration"""
 
     def __init__(self):
         self.profile = "default"
+        self._api_cache: Dict[Tuple[str, str], ApiFactory] = {}
+        self._config_cache: Optional[tomlkit.TOMLDocument] = None
+        self._config_mtime: Optional[int] = None
+        self._data_cache: Optional[dict] = None
+        self._data_mtime: Optional[int] = None
+        self._token_cache: Dict[str, Optional[str]] = {}
+        self._keyring: Optional["keyring.backend.KeyringBackend"] = None
 
     @property
     def config_path(self) -> Path:
@@ -28,15 +40,58 @@ class ConfigManager:
 
         return Path(appdirs.user_config_dir("fxf", "flux-capacitor")) / "config.toml"
 
+    def _get_config_mtime(self) -> Optional[int]:
+        """Modification time of the configuration file, or None if it does
+        not exist"""
+
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
     def get_config(self) -> tomlkit.TOMLDocument:
         """Reads the configuration file and returns a TOML document, even if
-        the configuration file does not exist yet"""
+        the configuration file does not exist yet. The document is kept in
+        memory until the file changes."""
 
-        if self.config_path.exists():
+        mtime = self._get_config_mtime()
+
+        if self._config_cache is not None and mtime == self._config_mtime:
+            return self._config_cache
+
+        if mtime is not None:
             with self.config_path.open() as f:
-                return tomlkit.parse(f.read())
+                config = tomlkit.parse(f.read())
         else:
-            return tomlkit.document()
+            config = tomlkit.document()
+
+        self._config_cache = config
+        self._config_mtime = mtime
+
+        return config
+
+    def _read_config_fast(self) -> dict:
+        """Reads the configuration as plain data, for read-only purposes.
+        This skips the formatting-preserving parse of tomlkit (when tomllib
+        is available) and is cached until the file changes."""
+
+        mtime = self._get_config_mtime()
+
+        if self._data_cache is not None and mtime == self._data_mtime:
+            return self._data_cache
+
+        if mtime is None:
+            data = {}
+        elif tomllib is None:
+            data = self.get_config().unwrap()
+        else:
+            with self.config_path.open("rb") as f:
+                data = tomllib.load(f)
+
+        self._data_cache = data
+        self._data_mtime = mtime
+
+        return data
 
     def write_config(self, config: tomlkit.TOMLDocument):
         """Writes back the TOML document to the configuration file's
@@ -47,9 +102,13 @@ class ConfigManager:
         with self.config_path.open("w") as f:
             f.write(config.as_string())
 
-    def get_api(self, base_url: str, token: str = "") -> ApiFactory:
-        """Returns an API client for the given base URL and token. If no token
-        is provided then we'll get it from the keyring."""
+        self._config_cache = config
+        self._config_mtime = self._get_config_mtime()
+        self._data_cache = None
+
+    def _require_token(self, base_url: str, token: str) -> str:
+        """Returns the provided token or, if empty, the one from the keyring.
+        Raises MissingTokenError if none can be found."""
 
         if not token:
             token = self._get_token(base_url)
@@ -59,59 +118,104 @@ class ConfigManager:
                 f"No token found for {base_url} (profile: {self.profile})"
             )
 
-        return ApiFactory(base_url, token)
+        return token
+
+    def get_api(self, base_url: str, token: str = "") -> ApiFactory:
+        """Returns an API client for the given base URL and token. If no token
+        is provided then we'll get it from the keyring.
+
+        Factories are cached and kept open until close_all() is called, so
+        that successive calls to the same instance share a connection pool."""
+
+        token = self._require_token(base_url, token)
+        key = (base_url, token)
+
+        if key not in self._api_cache:
+            api = ApiFactory(base_url, token)
+            api.__enter__()
+            self._api_cache[key] = api
+
+        return self._api_cache[key]
+
+    def get_async_api(self, base_url: str, token: str = "") -> AsyncApiFactory:
+        """Same as get_api() but returns an asynchronous API client. Those are
+        bound to an event loop, so they are not cached."""
+
+        return AsyncApiFactory(base_url, self._require_token(base_url, token))
+
+    def close_all(self) -> None:
+        """Releases the clients of all the cached API factories"""
+
+        while self._api_cache:
+            _, api = self._api_cache.popitem()
+            api.__exit__(None, None, None)
 
     @contextmanager
     def edit_profile(self) -> tomlkit.TOMLDocument:
         """Helper context manager to allow modifying a profile by getting its
         document. When the context manager exits, the modified document will
-        be written into the configuration."""
+        be written into the configuration. If anything fails along the way,
+        the cached document is dropped so that the partial changes don't leak
+        into later reads."""
 
         config = self.get_config()
 
-        if "profiles" not in config:
-            config.add("profiles", tomlkit.table())
+        try:
+            if "profiles" not in config:
+                config.add("profiles", tomlkit.table())
 
-        if self.profile not in config["profiles"]:
-            config["profiles"].add(self.profile, tomlkit.table())
+            if self.profile not in config["profiles"]:
+                config["profiles"].add(self.profile, tomlkit.table())
 
-        yield config["profiles"][self.profile]
+            yield config["profiles"][self.profile]
 
-        self.write_config(config)
+            self.write_config(config)
+        except BaseException:
+            self._config_cache = None
+            raise
 
-    def get_profile(self) -> tomlkit.items.Table:
+    def get_profile(self) -> Mapping:
         """Finds a specific profile for reading purposes into the
-        configuration. If the profile doesn't exist you'll get an empty TOML
-        document."""
+        configuration. If the profile doesn't exist you'll get an empty
+        mapping."""
 
-        config = self.get_config()
+        config = self._read_config_fast()
 
         if "profiles" not in config:
-            return tomlkit.table()
+            return {}
 
         if self.profile not in config["profiles"]:
-            return tomlkit.table()
+            return {}
 
         return config["profiles"][self.profile]
 
-    def get_keyring(self) -> keyring.backend.KeyringBackend:
+    def get_keyring(self) -> "keyring.backend.KeyringBackend":
         """Wrapper to get the keyring. For now there is no configuration
         happening but in the future there might be, so we're creating a central
-        call point here."""
+        call point here. The backend is looked up only once per manager."""
 
-        return keyring.get_keyring()
+        if self._keyring is None:
+            import keyring
+
+            self._keyring = keyring.get_keyring()
+
+        return self._keyring
 
     def _save_token(self, base_url: str, token: str):
         """Saves a token into the keyring"""
 
         kr = self.get_keyring()
         kr.set_password("fxf", base_url, token)
+        self._token_cache[base_url] = token
 
     def _get_token(self, base_url: str) -> str:
         """Gets a token from the keyring"""
 
-        kr = self.get_keyring()
-        return kr.get_password("fxf", base_url)
+        if base_url not in self._token_cache:
+            kr = self.get_keyring()
+            self._token_cache[base_url] = kr.get_password("fxf", base_url)
+
+        return self._token_cache[base_url]
 
     def save_credentials(self, base_url: str, token: str):
         """Saves a given token for a base URL into both configuration and
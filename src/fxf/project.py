@@ -2,18 +2,41 @@ import subprocess
 from pathlib import Path
 from typing import Optional
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 
 class ProjectManager:
-    """Wrapper around Git to manage things related to a physical project"""
+    """Wrapper around Git to manage things related to a physical project.
+
+    When pygit2 is installed the repository is read through libgit2 directly,
+    otherwise we fall back to calling the git binary."""
 
     def __init__(self, anchor: Path):
         self.anchor = anchor
+        self._repo = self._open_repo()
         self.git_root = self.find_git_root()
 
     @property
     def is_valid(self) -> bool:
         return self.git_root is not None
 
+    def _open_repo(self) -> Optional["pygit2.Repository"]:
+        if pygit2 is None:
+            return None
+
+        try:
+            path = pygit2.discover_repository(str(self.anchor))
+
+            if path is None:
+                return None
+
+            return pygit2.Repository(path)
+        except pygit2.GitError:
+            return None
+
     def _check_output(self, *args, **kwargs):
         return (
             subprocess.check_output(
@@ -27,12 +50,27 @@ class ProjectManager:
         )
 
     def find_git_root(self) -> Optional[Path]:
+        if pygit2 is not None:
+            if self._repo is None or self._repo.workdir is None:
+                return None
+
+            return Path(self._repo.workdir)
+
         try:
             return Path(self._check_output("git", "rev-parse", "--show-toplevel"))
         except subprocess.CalledProcessError:
             return None
 
     def get_origin(self) -> Optional[str]:
+        if pygit2 is not None:
+            if self._repo is None:
+                return None
+
+            try:
+                return self._repo.remotes["origin"].url
+            except KeyError:
+                return None
+
         try:
             return self._check_output("git", "config", "--get", "remote.origin.url")
         except subprocess.CalledProcessError: